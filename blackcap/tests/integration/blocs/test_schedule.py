@@ -7,6 +7,7 @@ from blackcap.blocs.schedule import create_schedule, generate_create_schedule_fl
 from blackcap.configs import config_registry
 from blackcap.flow import Executor, FlowStatus
 from blackcap.scheduler import scheduler_registry
+from blackcap.scheduler.base import BaseScheduler
 from blackcap.models.schedule import ScheduleDB
 from blackcap.schemas.api.schedule.delete import ScheduleDelete
 from blackcap.schemas.api.schedule.get import ScheduleGetQueryParams, ScheduleQueryType
@@ -18,18 +19,29 @@ from blackcap.schemas.schedule import Schedule
 from blackcap.schemas.user import User
 
 from logzero import logger
+import pytest
 
 from sqlalchemy import select
 from sqlalchemy.orm.session import Session
 
 
-config = config_registry.get_config()
-scheduler = scheduler_registry.get_scheduler(config.SCHEDULER)
+@pytest.fixture(scope="module")
+def scheduler() -> BaseScheduler:
+    config = config_registry.get_config()
+    return scheduler_registry.get_scheduler(config.SCHEDULER)
 
 
-def test_scheduler_schedule(user: User, job: Job, cluster: Cluster) -> None:
+@pytest.fixture(scope="module")
+def scheduled_schedule_create_request(
+    scheduler: BaseScheduler, job: Job, cluster: Cluster
+) -> ScheduleCreate:
     schedule_create_request = ScheduleCreate(job_id=job.job_id)
-    scheduled_schedule_create_request = scheduler.schedule(schedule_create_request)
+    return scheduler.schedule(schedule_create_request)
+
+
+def test_scheduler_schedule(
+    user: User, job: Job, scheduled_schedule_create_request: ScheduleCreate
+) -> None:
     created_schedule = create_schedule([scheduled_schedule_create_request], user)[0]
     assert job.job_id == created_schedule.job_id
 
@@ -1,13 +1,16 @@
 """Conductor."""
 
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version  # type: ignore
-
-from celery import Celery
+from typing import Any, List, TYPE_CHECKING
 
 from conductor.configs import get_config
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+if TYPE_CHECKING:  # pragma: no cover
+    from celery import Celery
+
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session, sessionmaker
 
 
 try:
@@ -19,15 +22,95 @@ except PackageNotFoundError:  # pragma: no cover
 global_config = get_config()
 
 
-db_engine = create_engine(global_config.get_sql_db_uri())
-# Use this session for all db operations in the app
-DBSession = sessionmaker(db_engine)
+@lru_cache()
+def get_engine() -> "Engine":
+    """Create on first use, cache and return the database engine.
+
+    Returns:
+        Engine: SQLAlchemy engine
+    """
+    from sqlalchemy import create_engine
+
+    return create_engine(
+        global_config.get_sql_db_uri(),
+        pool_size=global_config.DB_POOL_SIZE,
+        max_overflow=global_config.DB_MAX_OVERFLOW,
+    )
+
+
+@lru_cache()
+def get_session_factory() -> "sessionmaker":
+    """Cache and return the session factory bound to the engine.
+
+    Returns:
+        sessionmaker: SQLAlchemy session factory
+    """
+    from sqlalchemy.orm import sessionmaker
+
+    return sessionmaker(get_engine())
+
+
+def DBSession() -> "Session":  # noqa: N802
+    """Create a new database session.
+
+    Use this session for all db operations in the app.
+
+    Returns:
+        Session: SQLAlchemy session
+    """
+    return get_session_factory()()
+
+
+@lru_cache()
+def get_celery_app() -> "Celery":
+    """Create on first use, cache and return the celery app.
+
+    Celery is only imported here, so processes that never
+    touch tasks don't pay for importing and configuring it.
+
+    Returns:
+        Celery: Celery app
+    """
+    from celery import Celery
+
+    celery_app = Celery(
+        __name__,
+        broker=global_config.CELERY_BROKER_URL,
+        backend=global_config.CELERY_RESULT_BACKEND,
+        include=["conductor.tasks"],
+    )
+    celery_app.conf.task_routes = {"conductor.tasks.*": {"queue": "conductor"}}
+    return celery_app
+
+
+def publish_task(name: str, args: List[Any]) -> None:
+    """Send a celery task by name without importing its module.
+
+    Args:
+        name (str): Fully qualified name of the task
+        args (List[Any]): Positional args of the task
+    """
+    get_celery_app().send_task(name, args=args)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve module attributes.
+
+    ``celery -A conductor worker`` looks the app up as ``conductor.celery``,
+    ``conductor.celery_app`` is kept for existing callers as is
+    ``conductor.db_engine``.
+
+    Args:
+        name (str): Name of the attribute
 
-celery_app = Celery(
-    __name__,
-    broker=global_config.CELERY_BROKER_URL,
-    backend=global_config.CELERY_RESULT_BACKEND,
-    include=["conductor.tasks"],
-)
+    Raises:
+        AttributeError: attribute not found
 
-celery_app.conf.task_routes = {"conductor.tasks.*": {"queue": "conductor"}}
+    Returns:
+        Any: Value of the attribute
+    """
+    if name in ("celery", "celery_app"):
+        return get_celery_app()
+    if name == "db_engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,11 @@
 """Cookie Auther implementation of Auther."""
 
-from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
-
-from bcrypt import checkpw, gensalt, hashpw
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import os
+from threading import Lock
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from conductor import DBSession, global_config
 from conductor.auther.base import BaseAuther
@@ -18,7 +20,122 @@ import jwt
 
 from logzero import logger
 
-from sqlalchemy import select
+from passlib.context import CryptContext
+
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+
+# Single place to configure how passwords are hashed and verified
+_PWD_CONTEXT = CryptContext(
+    schemes=["bcrypt"], bcrypt__rounds=global_config.BCRYPT_ROUNDS
+)
+
+# bcrypt is CPU bound, hash passwords in worker processes
+# so bulk registrations are spread across all the cores.
+_BCRYPT_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def _hash_password(password: str) -> bytes:
+    """Hash a password with a freshly generated salt.
+
+    Args:
+        password (str): Password
+
+    Returns:
+        bytes: Encoded hash of the password
+    """
+    return _PWD_CONTEXT.hash(password).encode()
+
+
+# Hash to verify against when a user is not found. Built at import so
+# the first unknown email doesn't take longer than the following ones.
+_DUMMY_HASH = _hash_password("not a real password")
+
+
+# Signing key is encoded once instead of on every encode and decode
+_JWT_KEY = (
+    global_config.SECRET_KEY.encode()
+    if isinstance(global_config.SECRET_KEY, str)
+    else global_config.SECRET_KEY
+)
+_JWT_ALGORITHM = "HS256"
+# Cookie lifetime, the exp claim is written as an int epoch
+_JWT_EXPIRE_SECONDS = global_config.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+# LRU of already verified cookies, entries are dropped once they expire
+_JWT_CACHE_SIZE = 10_000
+_JWT_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_JWT_CACHE_LOCK = Lock()
+
+
+def _decode_cookie(user_cookie_encoded: str) -> Dict[str, Any]:
+    """Decode and verify a cookie, reusing earlier verifications.
+
+    Args:
+        user_cookie_encoded (str): Encoded cookie
+
+    Returns:
+        Dict[str, Any]: Decoded cookie
+    """
+    with _JWT_CACHE_LOCK:
+        user_cookie_decoded = _JWT_CACHE.pop(user_cookie_encoded, None)
+        if user_cookie_decoded is not None and user_cookie_decoded["exp"] > time.time():
+            _JWT_CACHE[user_cookie_encoded] = user_cookie_decoded
+            return user_cookie_decoded
+
+    # Expired cookies were dropped above, so decode rejects them as before
+    user_cookie_decoded = jwt.decode(
+        user_cookie_encoded,
+        _JWT_KEY,
+        algorithms=[_JWT_ALGORITHM],
+    )
+    # Cookies without an expiry are verified every time
+    if "exp" not in user_cookie_decoded:
+        return user_cookie_decoded
+    with _JWT_CACHE_LOCK:
+        _JWT_CACHE[user_cookie_encoded] = user_cookie_decoded
+        if len(_JWT_CACHE) > _JWT_CACHE_SIZE:
+            _JWT_CACHE.popitem(last=False)
+    return user_cookie_decoded
+
+
+def _protagonist_by_email_stmt(email: str) -> StatementLambdaElement:
+    """Select a protagonist by email.
+
+    Lambda statements are compiled once and only rebind the email
+    on later calls.
+
+    Args:
+        email (str): Email of the protagonist
+
+    Returns:
+        StatementLambdaElement: Select statement
+    """
+    return lambda_stmt(
+        lambda: select(ProtagonistDB).where(ProtagonistDB.email == email)
+    )
+
+
+def _user_by_email_stmt(email: str) -> StatementLambdaElement:
+    """Select the columns of a User by email.
+
+    Args:
+        email (str): Email of the user
+
+    Returns:
+        StatementLambdaElement: Select statement
+    """
+    return lambda_stmt(
+        lambda: select(
+            ProtagonistDB.id,
+            ProtagonistDB.name,
+            ProtagonistDB.organisation,
+            ProtagonistDB.email,
+            ProtagonistDB.active,
+        ).where(ProtagonistDB.email == email)
+    )
 
 
 class CookieAuther(BaseAuther):
@@ -40,19 +157,26 @@ class CookieAuther(BaseAuther):
         """
         with DBSession() as session:
             try:
-                protagonist_objs = [
-                    ProtagonistDB(
-                        password=hashpw(
-                            user_create.password.encode(), gensalt()
-                        ),  # noqa:E501
+                # Submit all the hashes first and gather them afterwards
+                password_futures = [
+                    _BCRYPT_POOL.submit(_hash_password, user_create.password)
+                    for user_create in user_create_list
+                ]
+                protagonist_mappings = [
+                    dict(
+                        password=password_future.result(),
                         **user_create.user.dict(exclude={"user_id"}),
                     )
-                    for user_create in user_create_list
+                    for user_create, password_future in zip(
+                        user_create_list, password_futures
+                    )
                 ]
-                ProtagonistDB.bulk_create(protagonist_objs, session)
+                created_mappings = ProtagonistDB.bulk_create(
+                    protagonist_mappings, session
+                )
                 return [
-                    User(user_id=obj.id, **obj.to_dict())
-                    for obj in protagonist_objs  # noqa: E501
+                    User(user_id=mapping["id"], **mapping)
+                    for mapping in created_mappings
                 ]
             except Exception as e:
                 session.rollback()
@@ -76,42 +200,34 @@ class CookieAuther(BaseAuther):
         with DBSession() as session:
             try:
                 # Find user
-                stmt = select(ProtagonistDB).where(
-                    ProtagonistDB.email == user_creds.email
-                )
-                user_list: List[ProtagonistDB] = (
-                    session.execute(stmt).scalars().all()
+                stmt = _protagonist_by_email_stmt(user_creds.email)
+                user: Optional[ProtagonistDB] = (
+                    session.execute(stmt).scalars().first()
                 )  # noqa: E501
-                # return early if user not found
-                if len(user_list) == 0:
+                # Always check a password hash, even if user is not found,
+                # so the response time doesn't reveal registered emails
+                has_password = user is not None and user.password is not None
+                password_hash = user.password if has_password else _DUMMY_HASH
+                password_ok = _PWD_CONTEXT.verify(user_creds.password, password_hash)
+                if not (has_password and password_ok):
                     return None
 
-                # Check password hash
-                if checkpw(
-                    user_creds.password.encode(), user_list[0].password
-                ):  # noqa: E501
-                    # Create cookie and return user and cookie
-                    user_cookie = jwt.encode(
-                        {
-                            "exp": datetime.utcnow()
-                            + timedelta(
-                                minutes=global_config.ACCESS_TOKEN_EXPIRE_MINUTES  # noqa: E501
-                            ),
-                            "sub": user_list[0].email,
-                            "email": user_list[0].email,
-                            "name": user_list[0].name,
-                            "organisation": user_list[0].organisation,
-                        },
-                        global_config.SECRET_KEY,
-                    )
-                    return (
-                        User(
-                            user_id=user_list[0].id, **user_list[0].to_dict()
-                        ),  # noqa: E501
-                        user_cookie,
-                    )
-                else:
-                    return None
+                # Create cookie and return user and cookie
+                user_cookie = jwt.encode(
+                    {
+                        "exp": int(time.time()) + _JWT_EXPIRE_SECONDS,
+                        "sub": user.email,
+                        "email": user.email,
+                        "name": user.name,
+                        "organisation": user.organisation,
+                    },
+                    _JWT_KEY,
+                    algorithm=_JWT_ALGORITHM,
+                )
+                return (
+                    User(user_id=user.id, **user.to_dict()),
+                    user_cookie,
+                )
             except Exception as e:
                 session.rollback()
                 logger.error(f"Unable to login user due to: {e}")
@@ -142,11 +258,7 @@ class CookieAuther(BaseAuther):
                 return None
             # try to decode the cookie
             try:
-                user_cookie_decoded = jwt.decode(
-                    user_cookie_encoded,
-                    global_config.SECRET_KEY,
-                    algorithms=["HS256"],  # noqa: E501
-                )
+                user_cookie_decoded = _decode_cookie(user_cookie_encoded)
             except jwt.DecodeError as e:
                 # return none if failed to decode cookie
                 logger.error(f"Unable to decode cookie due to: {e}")
@@ -156,17 +268,14 @@ class CookieAuther(BaseAuther):
                 raise e
 
             # Fetch and return user if present or None
-            stmt = select(ProtagonistDB).where(
-                ProtagonistDB.email == user_cookie_decoded["email"]
-            )
-            user_list: List[ProtagonistDB] = (
-                session.execute(stmt).scalars().all()
-            )  # noqa: E501
+            # Only the columns of User are selected, skipping the hash
+            stmt = _user_by_email_stmt(user_cookie_decoded["email"])
+            user_row = session.execute(stmt).first()
             # return early if user not found
-            if len(user_list) == 0:
+            if user_row is None:
                 return None
             else:
-                return User(user_id=user_list[0].id, **user_list[0].to_dict())
+                return User(user_id=user_row.id, **user_row._asdict())
 
     def authorize_user(
         self: "BaseAuther", user: User, request: Request
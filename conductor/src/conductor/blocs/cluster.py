@@ -1,6 +1,6 @@
 """Cluster BLoCs."""
 
-from typing import List
+from typing import Any, Dict, List
 
 from conductor import DBSession
 from conductor.models.cluster import ClusterDB
@@ -32,16 +32,14 @@ def create_cluster(
     """
     with DBSession() as session:
         try:
-            cluster_db_create_list: List[ClusterDB] = [
-                ClusterDB(
-                    **cluster_create.cluster.dict(exclude={"cluster_id"})
-                )  # noqa: E501
+            cluster_db_create_list: List[Dict[str, Any]] = [
+                cluster_create.cluster.dict(exclude={"cluster_id"})
                 for cluster_create in cluster_create_list
             ]
-            ClusterDB.bulk_create(cluster_db_create_list, session)
+            created_mappings = ClusterDB.bulk_create(cluster_db_create_list, session)
             return [
-                Cluster(cluster_id=obj.id, **obj.to_dict())
-                for obj in cluster_db_create_list
+                Cluster(cluster_id=mapping["id"], **mapping)
+                for mapping in created_mappings
             ]
         except Exception as e:
             session.rollback()
@@ -1,6 +1,6 @@
 """Job BLoCs."""
 
-from typing import List
+from typing import Any, Dict, List
 
 from conductor import DBSession
 from conductor.models.job import JobDB
@@ -29,17 +29,16 @@ def create_job(job_create_list: List[JobCreate]) -> List[Job]:
     """
     with DBSession() as session:
         try:
-            job_db_create_list: List[JobDB] = [
-                JobDB(
+            job_db_create_list: List[Dict[str, Any]] = [
+                dict(
                     protagonist_id=job_create.user.user_id,
                     **job_create.job.dict(exclude={"job_id"}),  # noqa: E501
                 )
                 for job_create in job_create_list
             ]
-            JobDB.bulk_create(job_db_create_list, session)
+            created_mappings = JobDB.bulk_create(job_db_create_list, session)
             return [
-                Job(job_id=obj.id, **obj.to_dict())
-                for obj in job_db_create_list  # noqa: E501
+                Job(job_id=mapping["id"], **mapping) for mapping in created_mappings
             ]
         except Exception as e:
             session.rollback()
@@ -0,0 +1,63 @@
+"""Benchmark commands."""
+# flake8: noqa: DAR101
+
+from statistics import median
+import time
+
+import click
+
+from conductor import global_config
+from conductor.auther.cookie_auther import _PWD_CONTEXT
+
+
+@click.command(name="bench-bcrypt")
+@click.option(
+    "--target_ms",
+    default=global_config.BCRYPT_TARGET_MS,
+    help="target time of a single hash in milliseconds",
+)
+@click.option(
+    "--min_rounds",
+    default=8,
+    type=click.IntRange(4, 31),
+    help="lowest bcrypt cost to try",
+)
+@click.option(
+    "--max_rounds",
+    default=14,
+    type=click.IntRange(4, 31),
+    help="highest bcrypt cost to try",
+)
+@click.option(
+    "--samples",
+    default=5,
+    type=click.IntRange(1),
+    help="number of hashes timed per cost",
+)
+def bench_bcrypt(
+    target_ms: int, min_rounds: int, max_rounds: int, samples: int
+) -> None:
+    """Find the bcrypt cost closest to the target hash time."""
+    if min_rounds > max_rounds:
+        raise click.BadParameter(
+            f"{min_rounds} is greater than --max_rounds {max_rounds}",
+            param_hint="--min_rounds",
+        )
+    timings = {}
+    for rounds in range(min_rounds, max_rounds + 1):
+        # time the same passlib context the auther hashes passwords with
+        pwd_context = _PWD_CONTEXT.copy(bcrypt__rounds=rounds)
+        sample_timings = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            pwd_context.hash("benchmark")
+            sample_timings.append((time.perf_counter() - start) * 1000)
+        timings[rounds] = median(sample_timings)
+        click.secho(f"rounds: {rounds}, median time: {timings[rounds]:.1f}ms")
+
+    best_rounds = min(timings, key=lambda r: abs(timings[r] - target_ms))
+    click.secho(
+        f"\nCost closest to {target_ms}ms: {best_rounds}\n\n"
+        f"Add it to your env\n\n export BCRYPT_ROUNDS={best_rounds}",
+        fg="green",
+    )
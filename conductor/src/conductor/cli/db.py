@@ -2,7 +2,7 @@
 
 import click
 
-from conductor import db_engine
+from conductor import get_engine
 from conductor.models.meta.mixins import DBModel
 
 
@@ -10,21 +10,21 @@ from conductor.models.meta.mixins import DBModel
 def init() -> None:
     """Init database."""
     click.secho("Creating database!", fg="green")
-    DBModel.metadata.create_all(db_engine)
+    DBModel.metadata.create_all(get_engine())
 
 
 @click.command()
 def destroy() -> None:
     """Destroy database."""
     click.secho("Destroying database!", fg="red")
-    DBModel.metadata.drop_all(db_engine)
+    DBModel.metadata.drop_all(get_engine())
 
 
 @click.command()
 def reset() -> None:
     """Reset database."""
-    DBModel.metadata.drop_all(db_engine)
-    DBModel.metadata.create_all(db_engine)
+    DBModel.metadata.drop_all(get_engine())
+    DBModel.metadata.create_all(get_engine())
 
 
 @click.group()
@@ -2,27 +2,44 @@
 
 # flake8: noqa
 
-import os
+from importlib import import_module
 
 import click
 
-from conductor.cli.create import create
-from conductor.cli.db import db
-from conductor.cli.get import get
-from conductor.cli.publish import pub
-from conductor.cli.schedule import sched
-from conductor.cli.subscribe import sub
-from conductor.extentions import auther
 from conductor.schemas.api.auth.post import AuthUserCreds
 
 
 from .. import __version__
 
 
+class LazyGroup(click.Group):
+    """Click group that imports subcommands only when they are used.
+
+    Subcommand modules pull in SQLAlchemy, Celery and the extensions,
+    so they are not imported for e.g. ``conductor --version``.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # subcommand name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(list(super().list_commands(ctx)) + list(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(import_module(module_name), attr_name)
+        return super().get_command(ctx, cmd_name)
+
+
 @click.command()
 @click.option("--email", required=True, help="email of user")
 @click.option("--password", required=True, help="password of user")
 def login(email, password) -> None:
+    from conductor.extentions import auther
+
     auth_creds = AuthUserCreds(email=email, password=password)
     login_tuple = auther.login_user(auth_creds)
     if login_tuple is None:
@@ -32,17 +49,22 @@ def login(email, password) -> None:
         click.secho(f"Add it to your env\n\n export USER_ACCESS_TOKEN={login_tuple[1]}")
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": "conductor.cli.create:create",
+        "get": "conductor.cli.get:get",
+        "db": "conductor.cli.db:db",
+        "pub": "conductor.cli.publish:pub",
+        "sched": "conductor.cli.schedule:sched",
+        "sub": "conductor.cli.subscribe:sub",
+        "bench-bcrypt": "conductor.cli.bench:bench_bcrypt",
+    },
+)
 @click.version_option(version=__version__)
 def main() -> None:
     """Conductor console."""
     pass
 
 
-main.add_command(create)
-main.add_command(get)
-main.add_command(db)
-main.add_command(pub)
-main.add_command(sched)
 main.add_command(login)
-main.add_command(sub)
@@ -7,12 +7,15 @@ from pathlib import Path
 
 import click
 
+from conductor import publish_task
 from conductor.schemas.message import Message, MessageType
-from conductor.tasks.pub_messenger import publish_messenger
 
 from logzero import logger
 
 
+PUBLISH_MESSENGER_TASK = "conductor.tasks.pub_messenger.publish_messenger"
+
+
 @click.command()
 @click.option(
     "--topic", default="test-topic", help="Id of the topic to publish msgs on"
@@ -27,7 +30,7 @@ def chatter(topic: str) -> None:
             data={"msg": msg},
             timestamp=str(datetime.now()),
         )
-        publish_messenger.delay(msg.dict(), topic)
+        publish_task(PUBLISH_MESSENGER_TASK, [msg.dict(), topic])
         logger.info(f"\nSuccess!\n\nMsg: {msg}")
     except Exception as e:
         logger.error(f"failed to publish msg: {e}")
@@ -47,7 +50,7 @@ def custom(topic: str, data: str) -> None:
             data={"msg": data},
             timestamp=str(datetime.now()),
         )
-        publish_messenger.delay(msg.dict(), topic)
+        publish_task(PUBLISH_MESSENGER_TASK, [msg.dict(), topic])
         logger.info(f"\nSuccess!\n\nMsg: {data}")
     except Exception as e:
         logger.error(f"failed to publish msg: {e}")
@@ -70,7 +73,7 @@ def job(topic: str, file: str) -> None:
                 data={"msg": data},
                 timestamp=datetime.now(),
             )
-            publish_messenger.delay(msg.dict(), topic)
+            publish_task(PUBLISH_MESSENGER_TASK, [msg.dict(), topic])
             logger.info(f"\nSuccess!\n\nMsg: {data}")
     except Exception as e:
         logger.error(f"failed to publish msg: {e}")
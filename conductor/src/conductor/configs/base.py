@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from pydantic import conint
 from pydantic.env_settings import BaseSettings
 
 from xdg import xdg_config_home
@@ -23,9 +24,13 @@ class BaseConfig(ABC, BaseSettings):
     DB_PASS: str = "postgres"
     DB_HOST: str = "localhost"
     DB_PORT: int = 5432
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SECRET_KEY = "ADD_A_RANDOM_KEY_HERE"  # noqa: S105
     ACCESS_TOKEN_EXPIRE_MINUTES = 1440
+    BCRYPT_ROUNDS: conint(ge=4, le=31) = 12
+    BCRYPT_TARGET_MS = 250
     USER_ACCESS_TOKEN: Optional[str]
     AUTHER = "COOKIE"
     MESSENGER = "GCP"
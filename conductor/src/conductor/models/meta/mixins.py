@@ -2,7 +2,8 @@
 
 import uuid
 from datetime import datetime
-from typing import Any, List, Optional, Union
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from conductor.models.meta.helpers import GUID
 
@@ -41,28 +42,72 @@ class CRUDMixin(object):
             Any: Instance of self
         """
         instance = cls(**kwargs)
-        return instance.save()
+        return instance.save(DBSession)
 
     @classmethod
-    def bulk_create(cls: Any, obj_list: List[Any], DBSession: Session) -> Any:
-        """Create a new records and save them to the database.
+    def bulk_create(
+        cls: Any,
+        mapping_list: Iterable[Dict[str, Any]],
+        DBSession: Session,
+        chunk_size: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """Insert mappings and return copies filled with column defaults.
+
+        Context-aware callable defaults are not supported and keys that are
+        not columns are ignored. Only the input is streamed: mappings are
+        inserted ``chunk_size`` at a time, but every created mapping is kept
+        in the returned list.
 
         Args:
-            list (List[Any]): List of self
+            mapping_list (Iterable[Dict[str, Any]]): Column mappings
             DBSession: (Session): database session to use
+            chunk_size (int): Number of mappings inserted at a time
 
         Returns:
-            Any: True if scuccess
+            List[Dict[str, Any]]: List of mappings of the created records
+
+        Raises:
+            ValueError: If chunk_size is smaller than 1 or a column has a
+                context-aware default
         """
-        DBSession.bulk_save_objects(obj_list, return_defaults=True)
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        return_defaults = False
+        column_defaults = []
+        for column in cls.__table__.columns:
+            default = column.default
+            if default is None or not (default.is_scalar or default.is_callable):
+                return_defaults = return_defaults or column.primary_key
+            elif default.is_callable and not hasattr(default.arg, "__wrapped__"):
+                # SQLAlchemy wraps only the defaults that take no context
+                raise ValueError(
+                    f"Context-aware default of {column.key} is not supported"
+                )
+            else:
+                column_defaults.append((column.key, default))
+
+        created_list: List[Dict[str, Any]] = []
+        mapping_iter = iter(mapping_list)
+        while True:
+            chunk = [dict(mapping) for mapping in islice(mapping_iter, chunk_size)]
+            if not chunk:
+                break
+            for key, default in column_defaults:
+                for mapping in chunk:
+                    if key not in mapping:
+                        mapping[key] = (
+                            default.arg(None) if default.is_callable else default.arg
+                        )
+            DBSession.bulk_insert_mappings(cls, chunk, return_defaults=return_defaults)
+            created_list.extend(chunk)
         DBSession.commit()
-        return True
+        return created_list
 
     def update(
         self: "CRUDMixin",
         DBSession: Session,
         commit: bool = True,
-        **kwargs: Any  # noqa: E501
+        **kwargs: Any,  # noqa: E501
     ) -> Any:
         """Update specific fields of a record.
 
@@ -79,23 +124,21 @@ class CRUDMixin(object):
         return commit and self.save(DBSession) or self
 
     @classmethod
-    def bulk_update(cls: Any, list: List[Any], DBSession: Session) -> Any:
-        """Create a new records and save them to the database.
+    def bulk_update(
+        cls: Any, mapping_list: List[Dict[str, Any]], DBSession: Session
+    ) -> List[Dict[str, Any]]:
+        """Update records from mappings and save them to the database.
 
         Args:
-            list (List[Any]): List of instances of self
+            mapping_list (List[Dict[str, Any]]): List of column mappings
             DBSession: (Session): database session to use
 
         Returns:
-            Any: List of updated instances self
+            List[Dict[str, Any]]: List of mappings of the updated records
         """
-        instance_list: List[Any] = []
-        for item in list:
-            instance_list.append(cls(**item))
-
-        DBSession.bulk_update_mappings(list)
+        DBSession.bulk_update_mappings(cls, mapping_list)
         DBSession.commit()
-        return instance_list
+        return mapping_list
 
     def save(
         self: "CRUDMixin", DBSession: Session, commit: bool = True
@@ -141,7 +184,7 @@ class DBModel(CRUDMixin, SerializerMixin, Base):
 class SurrogatePK(object):
     """Adds a surrogate int 'primary key' column named ``id`` to any orm class."""  # noqa: E501
 
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = {"keep_existing": True}
 
     id = Column(Integer, primary_key=True)
 
@@ -155,20 +198,20 @@ class SurrogatePK(object):
         Returns:
             Union[None, Any]: Return the instance of self if found or else None
         """
-        if any(
-            (
-                isinstance(record_id, str) and record_id.isdigit(),
-                isinstance(record_id, (int, float)),
-            )
-        ):
-            return cls.query.get(int(record_id))
-        return None
+        try:
+            int_record_id = int(record_id)
+        except (TypeError, ValueError):
+            return None
+        # reject floats that int() would silently truncate
+        if isinstance(record_id, float) and int_record_id != record_id:
+            return None
+        return cls.query.get(int_record_id)
 
 
 class SurrogatePKUUID(object):
     """Adds a surrogate int 'primary key' column named ``id`` to any orm class."""  # noqa: E501
 
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = {"keep_existing": True}
 
     id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
 
@@ -1,6 +1,6 @@
 """Server factory."""
 
-from conductor import celery_app
+from conductor import get_celery_app
 from conductor.configs.base import BaseConfig
 from conductor.routes.job import job_bp
 from conductor.routes.schedule import schedule_bp
@@ -45,7 +45,7 @@ def register_extensions(app: Flask) -> None:
     Args:
         app (Flask): Flask app
     """
-    init_celery(app, celery_app)
+    init_celery(app, get_celery_app())
     logger.info("Registered extensions")
 
 
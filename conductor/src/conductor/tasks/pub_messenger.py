@@ -1,13 +1,13 @@
 """Task to publish msgs to GCP Pub/Sub topic."""
 
-from conductor import celery_app
+from conductor import get_celery_app
 from conductor.extentions import messenger
 from conductor.schemas.message import Message
 
 from logzero import logger
 
 
-@celery_app.task
+@get_celery_app().task
 def publish_messenger(msg: Message, topic_id: str) -> None:
     """Publish msgs to GCP Pub/Sub topic.
 
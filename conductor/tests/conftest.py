@@ -6,7 +6,7 @@ from random import randint
 from bcrypt import gensalt, hashpw
 
 
-from conductor import db_engine, global_config
+from conductor import get_engine, global_config
 from conductor.models.cluster import ClusterDB
 from conductor.models.job import JobDB
 from conductor.models.meta.mixins import DBModel
@@ -46,19 +46,19 @@ def db() -> Generator[Session, None, None]:
         Iterator[Session]: [description]
     """
     try:
-        DBModel.metadata.drop_all(db_engine)
+        DBModel.metadata.drop_all(get_engine())
     except Exception as e:
         logger.error(f"fail to drop tables: {e}")
 
     try:
-        DBModel.metadata.create_all(db_engine)
+        DBModel.metadata.create_all(get_engine())
     except Exception as e:
         logger.error(f"fail to create tables: {e}")
 
-    yield sessionmaker(db_engine, expire_on_commit=False)
+    yield sessionmaker(get_engine(), expire_on_commit=False)
 
     try:
-        DBModel.metadata.drop_all(db_engine)
+        DBModel.metadata.drop_all(get_engine())
     except Exception:
         raise Exception("Unable to clean up Database")
 
@@ -0,0 +1,32 @@
+"""Test cluster BLoCs."""
+# flake8: noqa
+
+from conductor.blocs.cluster import create_cluster
+from conductor.models.cluster import ClusterDB
+from conductor.schemas.api.cluster.post import ClusterCreate
+from conductor.schemas.cluster import Cluster
+
+from logzero import logger
+
+from sqlalchemy import select
+from sqlalchemy.orm.session import Session
+
+
+def test_cluster_create_bloc(db: Session) -> None:
+    cluster = Cluster(
+        name="EBI_Embassy_2",
+        cluster_type="SLURM",
+        cluster_caps="CPU",
+        messenger="GCP",
+        messenger_queue="test-topic",
+    )
+    created_clusters = create_cluster([ClusterCreate(cluster=cluster)])
+    assert created_clusters[0].cluster_id is not None
+    with db() as session:
+        stmt = select(ClusterDB).where(ClusterDB.id == created_clusters[0].cluster_id)
+        try:
+            fetched_clusters = session.execute(stmt).scalars().all()
+        except Exception as e:
+            logger.error(f"Unable to fetch clusters: {e}")
+            raise e
+        assert "EBI_Embassy_2" == fetched_clusters[0].name
@@ -37,6 +37,7 @@ def test_job_create_bloc(user_dict: Dict, db: Session) -> None:
             logger.error(f"Unable to fetch jobs: {e}")
             raise e
         assert "cool_job" == fetched_jobs[0].name
+        assert created_jobs[0].name == "cool_job"
 
 
 def test_get_all_jobs_bloc(job_dict: Dict) -> None:
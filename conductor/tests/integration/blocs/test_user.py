@@ -2,6 +2,9 @@
 # flake8: noqa
 
 from typing import Dict
+
+from bcrypt import checkpw
+
 from conductor.blocs.user import create_user, delete_user, get_users, update_user
 from conductor.models.protagonist import ProtagonistDB
 from conductor.schemas.api.user.get import UserGetQueryParams, UserQueryType
@@ -24,6 +27,16 @@ def test_create_user_bloc(db: Session) -> None:
             ),
             password="IAMaPASS",
         )
+    ] + [
+        UserCreate(
+            user=User(
+                name=f"stark intern {i}",
+                organisation="stark industries",
+                email=f"intern{i}@stark.com",
+            ),
+            password=f"IAMaPASS{i}",
+        )
+        for i in range(4)
     ]
     created_user_list = create_user(create_user_list)
     with db() as session:
@@ -37,6 +50,13 @@ def test_create_user_bloc(db: Session) -> None:
             raise e
         assert created_user_list[0].email == fetched_users[0].email
 
+        # every stored hash must belong to the password of its own user
+        for user_create, created_user in zip(create_user_list, created_user_list):
+            stmt = select(ProtagonistDB).where(ProtagonistDB.id == created_user.user_id)
+            fetched_user = session.execute(stmt).scalars().first()
+            assert fetched_user.email == user_create.user.email
+            assert checkpw(user_create.password.encode(), fetched_user.password)
+
 
 def test_get_all_user_bloc(user_dict: Dict) -> None:
     query_params = UserGetQueryParams(query_type=UserQueryType.GET_ALL_USERS)
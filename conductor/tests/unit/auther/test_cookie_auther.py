@@ -0,0 +1,63 @@
+"""Cookie auther tests."""
+# flake8: noqa
+
+import time
+from typing import Optional
+
+from conductor.auther import cookie_auther
+
+import jwt
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+
+def _make_cookie(exp_offset: Optional[int] = 60, **claims: str) -> str:
+    if exp_offset is not None:
+        claims["exp"] = int(time.time()) + exp_offset
+    return jwt.encode(claims, cookie_auther._JWT_KEY, algorithm="HS256")
+
+
+@pytest.fixture(autouse=True)
+def empty_jwt_cache() -> None:
+    cookie_auther._JWT_CACHE.clear()
+
+
+def test_decode_cookie_cache_hit(mocker: MockerFixture) -> None:
+    cookie = _make_cookie(email="bruce@wayne.com")
+    decode_spy = mocker.spy(jwt, "decode")
+    first = cookie_auther._decode_cookie(cookie)
+    second = cookie_auther._decode_cookie(cookie)
+    assert first == second
+    assert first["email"] == "bruce@wayne.com"
+    assert decode_spy.call_count == 1
+
+
+def test_decode_cookie_expired_cached_cookie() -> None:
+    cookie = _make_cookie(exp_offset=-10, email="bruce@wayne.com")
+    # pretend the cookie was cached while it was still valid
+    cookie_auther._JWT_CACHE[cookie] = {
+        "exp": int(time.time()) - 10,
+        "email": "bruce@wayne.com",
+    }
+    with pytest.raises(jwt.ExpiredSignatureError):
+        cookie_auther._decode_cookie(cookie)
+    assert cookie not in cookie_auther._JWT_CACHE
+
+
+def test_decode_cookie_lru_eviction(mocker: MockerFixture) -> None:
+    mocker.patch.object(cookie_auther, "_JWT_CACHE_SIZE", 2)
+    cookies = [_make_cookie(email=f"user{i}@wayne.com") for i in range(3)]
+    for cookie in cookies:
+        cookie_auther._decode_cookie(cookie)
+    assert cookies[0] not in cookie_auther._JWT_CACHE
+    assert cookies[1] in cookie_auther._JWT_CACHE
+    assert cookies[2] in cookie_auther._JWT_CACHE
+
+
+def test_decode_cookie_without_exp() -> None:
+    cookie = _make_cookie(exp_offset=None, email="bruce@wayne.com")
+    assert cookie_auther._decode_cookie(cookie)["email"] == "bruce@wayne.com"
+    assert cookie not in cookie_auther._JWT_CACHE
+    assert cookie_auther._decode_cookie(cookie)["email"] == "bruce@wayne.com"
@@ -2,12 +2,15 @@
 # flake8: noqa
 
 from typing import Dict
+import uuid
 
 
 from conductor.models.cluster import ClusterDB
 
 from logzero import logger
 
+import pytest
+
 from sqlalchemy import select
 from sqlalchemy.orm.session import Session
 
@@ -31,3 +34,53 @@ def test_get_all_clusters(db: Session) -> None:
             logger.error(f"Unable to fetch clusters: {e}")
             raise e
         assert cluster.id in [str(c.id) for c in fetched_clusters]
+
+
+def test_bulk_create_clusters(db: Session) -> None:
+    cluster_mappings = [
+        {
+            "name": "EBI_Embassy_02",
+            "cluster_type": "SLURM",
+            "status": "ACTIVE",
+            "messenger_queue": "test-topic",
+            "not_a_column": "ignored",
+        }
+    ]
+    with db() as session:
+        created_mappings = ClusterDB.bulk_create(cluster_mappings, session)
+        stmt = select(ClusterDB).where(ClusterDB.name == "EBI_Embassy_02")
+        fetched_cluster = session.execute(stmt).scalars().first()
+    # input mappings are left untouched
+    assert "id" not in cluster_mappings[0]
+    # python side defaults are filled in the returned mappings
+    assert str(fetched_cluster.id) == created_mappings[0]["id"]
+    assert created_mappings[0]["created_at"] is not None
+    assert created_mappings[0]["messenger"] == "GCP"
+
+
+def test_bulk_create_clusters_in_chunks(db: Session) -> None:
+    cluster_mappings = (
+        {
+            "name": f"chunked_cluster_{i}",
+            "cluster_type": "SLURM",
+            "status": "ACTIVE",
+            "messenger_queue": "test-topic",
+        }
+        for i in range(5)
+    )
+    with db() as session:
+        created_mappings = ClusterDB.bulk_create(
+            cluster_mappings, session, chunk_size=2
+        )
+        stmt = select(ClusterDB).where(ClusterDB.name.like("chunked_cluster_%"))
+        fetched_clusters = session.execute(stmt).scalars().all()
+    assert len(created_mappings) == 5
+    assert {c.id for c in fetched_clusters} == {
+        uuid.UUID(m["id"]) for m in created_mappings
+    }
+
+
+def test_bulk_create_clusters_rejects_bad_chunk_size(db: Session) -> None:
+    with db() as session:
+        with pytest.raises(ValueError):
+            ClusterDB.bulk_create([], session, chunk_size=0)